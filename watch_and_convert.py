@@ -15,19 +15,67 @@ Usage: run in the directory to watch, or pass `--dir`.
 from __future__ import annotations
 
 import argparse
+import atexit
+import codecs
+import contextlib
+import functools
+import hashlib
+import json
 import logging
+import logging.handlers
 import os
+import queue
 import re
 import shutil
+import signal
 import subprocess
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, Tuple, Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Iterator, List, Tuple, Callable, TypeVar
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # watchdog is optional; the watcher falls back to polling
+    FileSystemEventHandler = object
+    Observer = None
 
 # Regex pattern to match blank samples (e.g., "Blank-02", "Blank_1", "Blank01")
 BLANK_PATTERN = re.compile(r"Blank[-_]?\d+", re.IGNORECASE)
 
+# Line breaks in converter output; bare "\r" covers progress-bar redraws
+OUTPUT_NEWLINE_PATTERN = re.compile(r"\r\n?|\n")
+
+# Converter output lines logged at INFO; everything else is DEBUG only
+OUTPUT_PROGRESS_PATTERN = re.compile(r"\d+(?:\.\d+)?\s*%")
+OUTPUT_PROBLEM_PATTERN = re.compile(r"error|warning|exception|traceback|failed", re.IGNORECASE)
+
+# Stability state persisted in the output directory across watcher restarts
+WATCH_STATE_FILE = ".watch_state.json"
+
+# In event mode, seconds between full rescans while no dataset is settling; they
+# only catch changes that raise no events (e.g. other clients writing to NFS/SMB)
+IDLE_RESCAN_SECONDS = 300
+
+# `.mzML` names per output directory, keyed on the directory mtime: {out_dir: (mtime_ns, names)}
+_mzml_names_cache: Dict[str, Tuple[int, set[str]]] = {}
+
+# mzML validity keyed on the file's size and mtime: {path: ((st_size, st_mtime_ns), valid)}
+_mzml_valid_cache: Dict[str, Tuple[Tuple[int, int], bool]] = {}
+
+# Set to wake the watch loop early (filesystem events, finished conversions, shutdown)
+_wake = threading.Event()
+# Set to make watch_directory return after its current pass (see stop_watching)
+_stop = threading.Event()
+# Set to make it abort running conversions instead of waiting for them
+_abort = threading.Event()
+
+# Optional thread pool for directory scans (see set_scan_threads); None scans serially
+_scan_executor: ThreadPoolExecutor | None = None
+
+T = TypeVar("T")
+
 
 def normalized_dataset_name(name: str) -> str:
     """Normalize dataset dir names by trimming trailing whitespace."""
@@ -50,16 +98,91 @@ def is_blank_sample(name: str) -> bool:
     """Check if a folder name represents a blank sample."""
     return bool(BLANK_PATTERN.search(name))
 
+def set_scan_threads(threads: int) -> None:
+    """Configure how many threads `dir_size` uses to scan subdirectories.
+
+    Scanning is I/O bound (the GIL is released during syscalls), so a small pool
+    helps most on network filesystems and spinning disks. `threads <= 1` scans
+    serially in the calling thread.
+    """
+    global _scan_executor
+    if _scan_executor is not None:
+        _scan_executor.shutdown(wait=False)
+    if threads > 1:
+        _scan_executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="dir-scan")
+    else:
+        _scan_executor = None
+
+
+def _walk(path: str, scan: Callable[[str], Tuple[T, List[str]]]) -> Iterator[T]:
+    """Apply `scan` to `path` and every subdirectory it reports, yielding results.
+
+    `scan(dir)` returns `(result, subdirs)`. Subdirectories are fanned out to the
+    scan pool when one is configured, otherwise walked with an explicit stack.
+    """
+    if _scan_executor is None:
+        stack = [path]
+        while stack:
+            result, subdirs = scan(stack.pop())
+            stack.extend(subdirs)
+            yield result
+        return
+
+    pending = {_scan_executor.submit(scan, path)}
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result, subdirs = future.result()
+                pending.update(_scan_executor.submit(scan, d) for d in subdirs)
+                yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _scan_sizes(path: str) -> Tuple[int, List[str]]:
+    """Return (total size of files directly in `path`, subdirectory paths)."""
+    total = 0
+    subdirs: List[str] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    else:
+                        total += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return total, subdirs
+
+
 def dir_size(path: str) -> int:
+    """Return total size in bytes of regular files below `path`.
+
+    Uses `os.scandir` so sizes come from `DirEntry.stat()` instead of a
+    separate `getsize` per file. Entries that vanish mid-scan are skipped.
+    """
+    return sum(_walk(path, _scan_sizes))
+
+
+def dir_size_bounded(path: str, abort_above: int | None = None) -> Tuple[int, bool]:
+    """Return `(total, complete)` for `path`, like `dir_size`.
+
+    If `abort_above` is given the walk stops as soon as the running total
+    exceeds it and returns `(partial_total, False)`; callers only need to know
+    that the size changed, not by how much.
+    """
     total = 0
-    for root, dirs, files in os.walk(path):
-        for f in files:
-            try:
-                fp = os.path.join(root, f)
-                total += os.path.getsize(fp)
-            except OSError:
-                pass
-    return total
+    for size in _walk(path, _scan_sizes):
+        total += size
+        if abort_above is not None and total > abort_above:
+            return total, False
+    return total, True
+
 
 def has_required_files(path: str, size_check_seconds: int = 1) -> bool:
     """Return True if the directory contains expected TDF files.
@@ -69,11 +192,24 @@ def has_required_files(path: str, size_check_seconds: int = 1) -> bool:
     that the folder contains data and should be considered by the watcher.
     """
     candidates = ("analysis.tdf", "analysis.tdf_bin")
-    for c in candidates:
-        if os.path.exists(os.path.join(path, c)):
-            return True
+    # Single readdir pass: name matches need no stat, file types come from the dirent.
+    # Either a TDF name or (fallback) any regular file answers True, so stop at the first.
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.name in candidates:
+                    return True
+                try:
+                    if entry.is_file():
+                        logging.debug("Found regular file in %s; treating as ready", path)
+                        return True
+                except OSError:
+                    pass
+    except OSError:
+        return False
 
-    # Optional quick size-stability check (1s by default)
+    # Optional quick size-stability check (1s by default) for folders whose data
+    # only lives in subdirectories so far
     if size_check_seconds and size_check_seconds > 0:
         try:
             first_size = dir_size(path)
@@ -86,15 +222,6 @@ def has_required_files(path: str, size_check_seconds: int = 1) -> bool:
         except Exception:
             logging.exception("Quick size-stability check failed for %s", path)
 
-    # Fallback: any regular file inside the directory
-    try:
-        for entry in os.listdir(path):
-            if os.path.isfile(os.path.join(path, entry)):
-                logging.debug("Found regular file in %s; treating as ready", path)
-                return True
-    except OSError:
-        return False
-
     return False
 
 
@@ -130,6 +257,27 @@ def is_valid_mzml(path: str, validate_interval: int = 1) -> bool:
         return False
 
 
+def is_valid_mzml_cached(path: str, validate_interval: int = 1) -> bool:
+    """Like `is_valid_mzml`, but reuse the last result while the file is unchanged.
+
+    An unchanged `(st_size, st_mtime_ns)` means the tail has not changed either,
+    so a finished output costs one stat per call instead of an open and read.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        _mzml_valid_cache.pop(path, None)
+        return False
+    key = (st.st_size, st.st_mtime_ns)
+    cached = _mzml_valid_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    valid = is_valid_mzml(path, validate_interval=validate_interval)
+    # keyed on the stat taken before validating, so a write during the check forces a recheck
+    _mzml_valid_cache[path] = (key, valid)
+    return valid
+
+
 def find_tdftools() -> Tuple[str, str]:
     """Return ('docker', image) if Docker is available, otherwise ('none','').
 
@@ -140,6 +288,90 @@ def find_tdftools() -> Tuple[str, str]:
     return ("none", "")
 
 
+def worker_container_name(data_dir: str) -> str:
+    """Return the fixed name of the worker container serving `data_dir`."""
+    digest = hashlib.sha1(os.path.abspath(data_dir).encode("utf-8")).hexdigest()
+    return f"tdf2mzml-watch-{digest[:12]}"
+
+
+def remove_stale_worker_container(data_dir: str) -> None:
+    """Remove a worker container for `data_dir` left behind by an earlier watcher.
+
+    Containers outlive a watcher that was killed or crashed, and a `docker exec`
+    conversion still running in one would race a fresh conversion of the same
+    dataset for its mzML, so it is removed along with the container.
+    """
+    name = worker_container_name(data_dir)
+    try:
+        result = subprocess.run(["docker", "rm", "-f", name], capture_output=True, text=True, timeout=60)
+    except (OSError, subprocess.TimeoutExpired):
+        return
+    # `docker rm` prints the name of each container it actually removed
+    if result.returncode == 0 and result.stdout.strip():
+        logging.warning("Removed stale worker container %s for %s", name, data_dir)
+
+
+def start_worker_container(data_dir: str, docker_image: str = "mfreitas/tdf2mzml") -> str | None:
+    """Start an idle long-lived container with `data_dir` mounted at `/data`.
+
+    Conversions can then use `docker exec` instead of paying container startup
+    for every dataset. The container is named after `data_dir` (see
+    `worker_container_name`) and replaces any stale one of that name. Returns
+    the container id, or None if it could not start.
+    """
+    remove_stale_worker_container(data_dir)
+    cmd = [
+        "docker",
+        "run",
+        "-d",
+        "--rm",
+        "--name",
+        worker_container_name(data_dir),
+        "--label",
+        f"converter-d-to-mzml.watch_dir={os.path.abspath(data_dir)}",
+        "-v",
+        f"{os.path.abspath(data_dir)}:/data",
+        "--entrypoint",
+        "tail",
+        docker_image,
+        "-f",
+        "/dev/null",
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logging.warning("Failed to start worker container: %s", e)
+        return None
+    if result.returncode != 0:
+        logging.warning("Failed to start worker container (rc=%s): %s", result.returncode, result.stderr.strip())
+        return None
+    container_id = result.stdout.strip()
+    logging.info("Started worker container %s for %s", container_id[:12], data_dir)
+    return container_id
+
+
+def is_container_running(container_id: str) -> bool:
+    """Return True if the Docker container `container_id` is running."""
+    try:
+        result = subprocess.run(
+            ["docker", "inspect", "-f", "{{.State.Running}}", container_id],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0 and result.stdout.strip() == "true"
+
+
+def stop_worker_container(container_id: str) -> None:
+    """Remove a container started by `start_worker_container` (errors are ignored)."""
+    try:
+        subprocess.run(["docker", "rm", "-f", container_id], capture_output=True, timeout=60)
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+
+
 def _safe_line_callback(
     callback: Callable[[str], None] | None,
     message: str,
@@ -153,6 +385,34 @@ def _safe_line_callback(
         pass
 
 
+def _emit_output_lines(
+    lines: List[str],
+    callback: Callable[[str], None] | None,
+) -> None:
+    """Log a batch of converter output lines and pass each to callback.
+
+    The whole batch is one DEBUG record. At INFO only the last progress line of
+    the batch and any error/warning lines are logged, again as one record.
+    """
+    texts = [text for text in (line.rstrip() for line in lines) if text]
+    if not texts:
+        return
+    logging.debug("\n".join(texts))
+    last_progress = next((t for t in reversed(texts) if OUTPUT_PROGRESS_PATTERN.search(t)), None)
+    summary = [t for t in texts if t is last_progress or OUTPUT_PROBLEM_PATTERN.search(t)]
+    if summary:
+        logging.info("\n".join(summary))
+    for text in texts:
+        _safe_line_callback(callback, text)
+
+
+def _raw_output_marker(text: str) -> bytes:
+    """Format `text` like an INFO log record for writing straight to the log file."""
+    now = time.time()
+    stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+    return f"{stamp},{int(now % 1 * 1000):03d} INFO: {text}\n".encode()
+
+
 def run_conversion(
     path: str,
     out_dir: str,
@@ -160,6 +420,9 @@ def run_conversion(
     dry_run: bool = False,
     line_callback: Callable[[str], None] | None = None,
     should_stop: Callable[[], bool] | None = None,
+    exec_container: str | None = None,
+    raw_output_path: str | None = None,
+    new_process_group: bool = False,
 ) -> tuple[int, str]:
     """Run conversion using Docker image `docker_image`.
 
@@ -169,6 +432,18 @@ def run_conversion(
     If line_callback is provided, it will be called with each stdout line.
     If should_stop is provided and returns True, the running Docker process is
     terminated and the function returns rc=130.
+    If exec_container is provided, the command runs via `docker exec` in that
+    container (see start_worker_container), which must already have the
+    dataset's parent directory mounted at `/data`. Stopping the `docker exec`
+    client does not stop the process inside the container, so callers that
+    rely on should_stop should not combine it with exec_container.
+    If raw_output_path is provided and there is no line_callback, Docker's
+    output is appended straight to that file by the child process between
+    begin/end markers, and nothing is read or logged line by line in Python.
+    This needs O_APPEND semantics, so on Windows output is still piped and logged.
+    If new_process_group is True, Docker runs in its own process group so a
+    console Ctrl-C aimed at the caller does not reach it; stop it through
+    should_stop or by removing the exec container instead.
     """
     tool_type, _ = find_tdftools()
     if tool_type != "docker":
@@ -179,8 +454,7 @@ def run_conversion(
         )
         return 2, ""
 
-    base_name = dataset_base_name(os.path.basename(os.path.normpath(path)))
-    out_name = os.path.join(out_dir, base_name + ".mzML")
+    out_name = expected_output_for_dir(path, out_dir)
 
     if os.path.exists(out_name):
         # Check if existing mzML is valid
@@ -215,33 +489,64 @@ def run_conversion(
     container_path = os.path.join("/data", os.path.basename(abs_path))
     container_out = os.path.join("/data", os.path.basename(out_name))
 
-    cmd = [
-        "docker",
-        "run",
-        "--rm",
-        "-v",
-        f"{parent}:/data",
-        docker_image,
-        "tdf2mzml.py",
-        "-i",
-        container_path,
-        "-o",
-        container_out,
-    ]
+    if exec_container:
+        cmd = [
+            "docker",
+            "exec",
+            exec_container,
+            "tdf2mzml.py",
+            "-i",
+            container_path,
+            "-o",
+            container_out,
+        ]
+    else:
+        cmd = [
+            "docker",
+            "run",
+            "--rm",
+            "-v",
+            f"{parent}:/data",
+            docker_image,
+            "tdf2mzml.py",
+            "-i",
+            container_path,
+            "-o",
+            container_out,
+        ]
     cmd_str = " ".join(cmd)
-    logging.info("Running Docker: %s", cmd_str)
-    
+
     # Log the command to callback
-    _safe_line_callback(
-        line_callback,
-        (
-            "🐳 Docker command: docker run --rm -v "
-            f"{parent}:/data {docker_image} tdf2mzml.py -i {container_path} -o {container_out}"
-        ),
-    )
+    _safe_line_callback(line_callback, f"🐳 Docker command: {cmd_str}")
     
-    # Stream output in real-time so progress can be logged
-    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1) as proc:
+    # Without a line callback the output can go straight from the child to the log
+    # file (O_APPEND), so Python never touches it. Windows only emulates append in
+    # the writing process, so the child would overwrite concurrent log records there.
+    raw_output = None
+    if raw_output_path and line_callback is None and os.name != "nt":
+        raw_output = open(raw_output_path, "ab", buffering=0)
+        # Markers are written directly, so queued log records may land on either side
+        # of them; the begin marker therefore carries the command itself
+        raw_output.write(_raw_output_marker(f"Running Docker: {cmd_str}\n--- begin docker output for {path} ---"))
+    else:
+        logging.info("Running Docker: %s", cmd_str)
+
+    popen_kwargs = {}
+    if new_process_group:
+        if os.name == "nt":
+            popen_kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            popen_kwargs["start_new_session"] = True
+
+    # Otherwise stream output in real-time so progress can be logged. The pipe is
+    # read in raw chunks and each chunk's lines are logged as one record.
+    with raw_output or contextlib.nullcontext(), subprocess.Popen(
+        cmd,
+        stdout=raw_output or subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=0,
+        **popen_kwargs,
+    ) as proc:
         stop_triggered = False
 
         def _watch_stop() -> None:
@@ -270,16 +575,24 @@ def run_conversion(
 
         try:
             if proc.stdout:
-                for line in proc.stdout:
+                fd = proc.stdout.fileno()
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                partial = ""
+                while True:
+                    chunk = os.read(fd, 65536)
                     if stop_triggered:
                         return 130, ""
-                    text = line.rstrip()
-                    logging.info(text)
-                    _safe_line_callback(line_callback, text)
+                    if not chunk:
+                        break
+                    *lines, partial = OUTPUT_NEWLINE_PATTERN.split(partial + decoder.decode(chunk))
+                    _emit_output_lines(lines, line_callback)
+                _emit_output_lines([partial + decoder.decode(b"", final=True)], line_callback)
         except Exception as e:
             logging.exception("Error reading subprocess output for %s", path)
             _safe_line_callback(line_callback, f"❌ Error reading Docker output: {e}")
         rc = proc.wait()
+        if raw_output is not None:
+            raw_output.write(_raw_output_marker(f"--- end docker output for {path} (rc={rc}) ---"))
         if stop_thread is not None and stop_thread.is_alive():
             stop_thread.join(timeout=0.5)
         if stop_triggered:
@@ -293,9 +606,204 @@ def run_conversion(
     return rc, out_name
 
 
+class _DatasetEventHandler(FileSystemEventHandler):
+    """Forward filesystem events to a queue as the owning `.d` directory path."""
+
+    # Reads (opened/closed_no_write) are ignored so conversions don't count as activity.
+    _RELEVANT_EVENTS = ("created", "modified", "moved", "deleted", "closed")
+
+    def __init__(self, watch_dir: str, events: queue.Queue):
+        super().__init__()
+        self.watch_dir = watch_dir
+        self.events = events
+
+    def _dataset_dir_for(self, path: str) -> str | None:
+        rel = os.path.relpath(path, self.watch_dir)
+        top = rel.split(os.sep, 1)[0]
+        if top in (os.curdir, os.pardir) or not is_dataset_dir_name(top) or is_blank_sample(top):
+            return None
+        return os.path.join(self.watch_dir, top)
+
+    def on_any_event(self, event) -> None:
+        if event.event_type not in self._RELEVANT_EVENTS:
+            return
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            if not path:
+                continue
+            if isinstance(path, bytes):
+                path = os.fsdecode(path)
+            dataset_dir = self._dataset_dir_for(path)
+            if dataset_dir is not None:
+                self.events.put(dataset_dir)
+                _wake.set()
+
+
+def _wait_for_events(
+    events: queue.Queue,
+    last_event: Dict[str, float],
+    timeout: float,
+    settle_seconds: float,
+) -> None:
+    """Record event times until a new dataset shows up or `timeout` elapses.
+
+    Events for datasets already being tracked only reset their debounce timer,
+    unless that timer (`settle_seconds`) would run out before `timeout`; then, as
+    for the first event of an unknown dataset, this returns so the caller rescans.
+    Any other `_wake` (finished conversion, shutdown) also returns immediately.
+    """
+    deadline = time.monotonic() + timeout
+    while not _stop.is_set():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        if not _wake.wait(timeout=remaining):
+            return
+        _wake.clear()
+        is_new = False
+        drained = False
+        while True:
+            try:
+                path = events.get_nowait()
+            except queue.Empty:
+                break
+            drained = True
+            is_new = is_new or path not in last_event
+            last_event[path] = time.monotonic()
+        if is_new or not drained or time.monotonic() + settle_seconds < deadline:
+            return
+
+
+def stop_watching(abort: bool = False) -> None:
+    """Ask a running `watch_directory` to stop scanning and return.
+
+    Queued conversions are dropped. Running ones are allowed to finish first,
+    or stopped if `abort` is True (which also cuts short an earlier graceful stop).
+    Only sets events, so it is safe to call from a signal handler.
+    """
+    if abort:
+        _abort.set()
+    _stop.set()
+    _wake.set()
+
+
+def load_watch_state(state_path: str) -> Tuple[Dict[str, Tuple[int, int]], Dict[str, int]]:
+    """Load persisted `(sizes, top_mtimes)` written by `save_watch_state`.
+
+    Entries whose directory is gone or whose top-level mtime no longer matches
+    the recorded one were touched while the watcher was down and are dropped.
+    """
+    try:
+        with open(state_path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+    except FileNotFoundError:
+        return {}, {}
+    except (OSError, ValueError):
+        logging.warning("Ignoring unreadable watch state %s", state_path)
+        return {}, {}
+
+    sizes: Dict[str, Tuple[int, int]] = {}
+    top_mtimes: Dict[str, int] = {}
+    if not isinstance(raw, dict):
+        return sizes, top_mtimes
+    for path, entry in raw.items():
+        try:
+            size, stable_count, mtime_ns = (int(v) for v in entry)
+            if os.stat(path).st_mtime_ns != mtime_ns:
+                continue
+        except (OSError, TypeError, ValueError):
+            continue
+        sizes[path] = (size, stable_count)
+        top_mtimes[path] = mtime_ns
+    return sizes, top_mtimes
+
+
+def save_watch_state(state_path: str, state: Dict[str, Tuple[int, int, int]]) -> None:
+    """Atomically write `{path: (size, stable_count, top_mtime_ns)}` to `state_path`."""
+    tmp_path = state_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({path: list(entry) for path, entry in state.items()}, f)
+    os.replace(tmp_path, state_path)
+
+
+def mzml_name_for(d_name: str) -> str:
+    """Return the mzML file name produced for dataset dir name `d_name`."""
+    return dataset_base_name(d_name) + ".mzML"
+
+
+@functools.lru_cache(maxsize=4096)
 def expected_output_for_dir(dirpath: str, out_dir: str) -> str:
-    base_name = dataset_base_name(os.path.basename(os.path.normpath(dirpath)))
-    return os.path.join(out_dir, base_name + ".mzML")
+    return os.path.join(out_dir, mzml_name_for(os.path.basename(os.path.normpath(dirpath))))
+
+
+def existing_mzml_names(out_dir: str) -> set[str]:
+    """Return names of `.mzML` files in `out_dir` (treat the result as read-only).
+
+    The listing is cached against the directory's mtime, which changes exactly
+    when an entry is added, removed or renamed, so between conversions this is a
+    single stat. Listings taken within a second or two of the last change are not
+    cached, since coarse mtime resolution could hide a following change.
+    """
+    try:
+        mtime_ns = os.stat(out_dir).st_mtime_ns
+    except OSError:
+        return set()
+    cached = _mzml_names_cache.get(out_dir)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    try:
+        with os.scandir(out_dir) as it:
+            names = {entry.name for entry in it if entry.name.endswith(".mzML")}
+    except OSError:
+        return set()
+    if time.time_ns() - mtime_ns > 2_000_000_000:
+        _mzml_names_cache[out_dir] = (mtime_ns, names)
+    else:
+        _mzml_names_cache.pop(out_dir, None)
+    return names
+
+
+def _dataset_dirs(watch_dir: str) -> List[Tuple[str, str, Tuple[int, int] | None]]:
+    """Return `(name, path, (st_dev, st_ino))` for each non-blank `.d` dir in `watch_dir`.
+
+    Aliases of one directory (symlinks, bind mounts) are listed once, preferring
+    the entry that is not a symlink so the output is named after the real
+    directory, then the smallest name, so the choice never depends on scandir
+    order. The id is None where the filesystem reports no inode numbers; such
+    entries are never deduplicated.
+    """
+    result: List[Tuple[str, str, Tuple[int, int] | None]] = []
+    # dir_id -> (index into result, (entry is a symlink, name)) of the preferred alias
+    by_id: Dict[Tuple[int, int], Tuple[int, Tuple[bool, str]]] = {}
+    with os.scandir(watch_dir) as it:
+        for entry in it:
+            d = entry.name
+            if not is_dataset_dir_name(d) or is_blank_sample(d):
+                continue
+            try:
+                if not entry.is_dir():
+                    continue
+                is_link = entry.is_symlink()
+                # os.stat, not DirEntry.stat(): the latter has st_ino == 0 on Windows
+                st = os.stat(entry.path)
+            except OSError:
+                continue
+            dir_id = (st.st_dev, st.st_ino) if st.st_ino else None
+            item = (d, entry.path, dir_id)
+            rank = (is_link, d)
+            seen = by_id.get(dir_id) if dir_id is not None else None
+            if seen is None:
+                if dir_id is not None:
+                    by_id[dir_id] = (len(result), rank)
+                result.append(item)
+                continue
+            idx, seen_rank = seen
+            if rank < seen_rank:
+                logging.debug("Skipping %s: same directory as %s", result[idx][1], entry.path)
+                result[idx] = item
+                by_id[dir_id] = (idx, rank)
+            else:
+                logging.debug("Skipping %s: same directory as %s", entry.path, result[idx][1])
+    return result
 
 
 def watch_directory(
@@ -307,25 +815,85 @@ def watch_directory(
     docker_image: str = "mfreitas/tdf2mzml",
     validate_interval: int = 0,
     max_workers: int = 1,
+    use_fs_events: bool = True,
+    reuse_container: bool = True,
+    docker_log_file: str | None = None,
 ):
+    _stop.clear()
+    _abort.clear()
+    _wake.clear()
     out_dir = out_dir or watch_dir
     os.makedirs(out_dir, exist_ok=True)
 
     known_processing = set()
+    # (st_dev, st_ino) of in-flight datasets, so an alias of the same .d (symlink,
+    # bind mount) is never converted while the original is running
+    processing_ids: Dict[str, Tuple[int, int] | None] = {}
 
-    logging.info("Watching %s every %ss, stability=%s, max_workers=%d", watch_dir, poll_interval, stability_checks, max_workers)
+    # Filesystem events (inotify/FSEvents/ReadDirectoryChangesW) replace size polling
+    # when watchdog is available: a dataset is stable once it has been quiet for
+    # `settle_seconds` with an unchanged size. While datasets are settling the watch
+    # dir is rescanned at least every poll_interval, otherwise every IDLE_RESCAN_SECONDS.
+    observer = None
+    handler = None
+    events: queue.Queue = queue.Queue()
+    last_event: Dict[str, float] = {}
+    # last_event value at which the baseline size in `sizes` was taken
+    baseline_at: Dict[str, float] = {}
+    watches: Dict[str, object] = {}
+    # same span the poller needs to see `stability_checks` equal sizes
+    settle_seconds = poll_interval * max(stability_checks - 1, 1)
+    if use_fs_events:
+        if Observer is None:
+            logging.warning("watchdog is not installed; falling back to polling")
+        else:
+            handler = _DatasetEventHandler(watch_dir, events)
+            observer = Observer()
+            observer.schedule(handler, watch_dir, recursive=False)
+            observer.start()
+
+    def _watch(path: str) -> None:
+        if observer is None or path in watches:
+            return
+        try:
+            watches[path] = observer.schedule(handler, path, recursive=True)
+        except Exception:
+            logging.exception("Failed to watch %s; relying on periodic rescans", path)
+
+    def _unwatch(path: str) -> None:
+        watch = watches.pop(path, None)
+        if watch is None:
+            return
+        try:
+            observer.unschedule(watch)
+        except Exception:
+            logging.debug("Failed to unschedule watch for %s", path, exc_info=True)
+
+    logging.info(
+        "Watching %s every %ss, stability=%s, max_workers=%d, mode=%s",
+        watch_dir,
+        poll_interval,
+        stability_checks,
+        max_workers,
+        "events" if observer is not None else "polling",
+    )
+
+    if reuse_container and not dry_run:
+        # stop conversions left running by a watcher that was killed, before their
+        # partial outputs are classified below
+        remove_stale_worker_container(watch_dir)
 
     # initial snapshot: list detected .d dirs and their states (excluding blanks)
-    all_dirs = [d for d in os.listdir(watch_dir) if is_dataset_dir_name(d) and os.path.isdir(os.path.join(watch_dir, d)) and not is_blank_sample(d)]
+    all_dirs = _dataset_dirs(watch_dir)
     pending = []
     done = []
     incomplete = []
-    for d in all_dirs:
-        p = os.path.join(watch_dir, d)
+    done_mzml = existing_mzml_names(out_dir)
+    for d, p, _ in all_dirs:
         expected = expected_output_for_dir(p, out_dir)
         # consider directory done only if expected mzML exists AND is valid
-        if os.path.exists(expected):
-            if is_valid_mzml(expected, validate_interval=validate_interval):
+        if mzml_name_for(d) in done_mzml:
+            if is_valid_mzml_cached(expected, validate_interval=validate_interval):
                 done.append(d)
             else:
                 incomplete.append(d)
@@ -339,116 +907,313 @@ def watch_directory(
     if done:
         logging.info("Done: %s", ", ".join(done))
 
-    sizes: Dict[str, Tuple[int, int]] = {}
+    # Resume stability tracking from the last run so a restart costs one confirming walk
+    state_path = os.path.join(out_dir, WATCH_STATE_FILE)
+    sizes, top_mtimes = load_watch_state(state_path)
+    if sizes:
+        logging.info("Resumed stability state for %d directories from %s", len(sizes), state_path)
+    if observer is not None:
+        # a resumed size serves as the baseline of an already elapsed quiet window
+        resumed_at = time.monotonic() - settle_seconds
+        for p, (size, _) in sizes.items():
+            if size >= 0:
+                last_event[p] = baseline_at[p] = resumed_at
+    saved_state: Dict[str, Tuple[int, int, int]] = {}
 
-    while True:
-        all_dirs = [d for d in os.listdir(watch_dir) if is_dataset_dir_name(d) and os.path.isdir(os.path.join(watch_dir, d)) and not is_blank_sample(d)]
-        # compute queue stats: done based on VALID mzML, in-progress tracked in-memory
-        done_count = 0
-        for d in all_dirs:
-            p = os.path.join(watch_dir, d)
-            expected = expected_output_for_dir(p, out_dir)
-            if os.path.exists(expected) and is_valid_mzml(expected, validate_interval=validate_interval):
-                done_count += 1
-        in_progress_count = len(known_processing)
-
-        # candidate directories that look ready (have required files and not already done/in-progress)
-        cand = []
-        for d in all_dirs:
-            p = os.path.join(watch_dir, d)
-            expected = expected_output_for_dir(p, out_dir)
-            # Only skip if mzML exists AND is valid
-            if os.path.exists(expected) and is_valid_mzml(expected, validate_interval=validate_interval):
-                continue
-            if p in known_processing:
-                continue
-            if has_required_files(p):
-                cand.append(d)
-
-        pending_count = len(cand)
-        logging.info("Status: total=%d pending=%d in_progress=%d done=%d", len(all_dirs), pending_count, in_progress_count, done_count)
-        for idx, name in enumerate(cand, start=1):
-            full = os.path.join(watch_dir, name)
-            if full in known_processing:
-                continue
+    # One idle container (watch_dir mounted at /data) serves every conversion via
+    # `docker exec`; it is (re)started on demand and removed when watching stops
+    container_lock = threading.Lock()
+    worker_container: str | None = None
+    # Set when watch_directory exits abnormally (e.g. a second Ctrl-C): running
+    # conversions are stopped instead of awaited
+    aborting = threading.Event()
 
-            try:
-                cur_size = dir_size(full)
-            except Exception as e:
-                logging.exception("Error computing size for %s: %s", full, e)
-                continue
-            last_size, stable_count = sizes.get(full, (cur_size, 0))
+    def ensure_worker_container() -> str | None:
+        nonlocal worker_container
+        if dry_run or not reuse_container or aborting.is_set():
+            return None
+        with container_lock:
+            if worker_container is not None and is_container_running(worker_container):
+                return worker_container
+            if worker_container is not None:
+                stop_worker_container(worker_container)
+            worker_container = start_worker_container(watch_dir, docker_image)
+            if worker_container is not None:
+                atexit.register(stop_worker_container, worker_container)
+            return worker_container
+
+    def convert_one(full_path: str) -> tuple[str, int, str]:
+        """Convert a single directory. Returns (path, rc, output_path)."""
+        logging.info("Starting conversion for %s", full_path)
+        try:
+            exec_container = ensure_worker_container()
+            # Docker gets its own process group so Ctrl-C only stops the watcher; an
+            # abort removes the exec container, or terminates `docker run` via should_stop
+            rc, expected_out = run_conversion(
+                full_path,
+                out_dir,
+                docker_image=docker_image,
+                dry_run=dry_run,
+                should_stop=None if exec_container else aborting.is_set,
+                exec_container=exec_container,
+                raw_output_path=docker_log_file,
+                new_process_group=True,
+            )
+        except Exception:
+            logging.exception("Conversion raised exception for %s", full_path)
+            rc, expected_out = 99, ""
+        return full_path, rc, expected_out
 
-            if cur_size == last_size:
-                stable_count += 1
+    def finish_conversion(full: str, future: Future) -> None:
+        """Record the outcome of a finished conversion future."""
+        try:
+            full_path, rc, expected_out = future.result()
+
+            if rc == 0:
+                output_valid = (
+                    bool(expected_out)
+                    and os.path.exists(expected_out)
+                    and is_valid_mzml_cached(expected_out, validate_interval=validate_interval)
+                )
+                if output_valid:
+                    logging.info("Conversion succeeded for %s; output: %s", full_path, expected_out)
+                else:
+                    logging.error(
+                        "Conversion reported rc=0 but output is missing/invalid for %s (expected %s)",
+                        full_path,
+                        expected_out,
+                    )
+                    # treat as failure so it can be retried
+                    sizes.pop(full_path, None)
             else:
-                stable_count = 0
+                logging.error("Conversion failed (rc=%s) for %s", rc, full_path)
+                sizes.pop(full_path, None)
+            # Track only in-flight directories in memory.
+            known_processing.discard(full_path)
+            processing_ids.pop(full_path, None)
+            top_mtimes.pop(full_path, None)
+            last_event.pop(full_path, None)
+            baseline_at.pop(full_path, None)
+        except Exception as e:
+            logging.exception("Worker exception for %s: %s", full, e)
+            known_processing.discard(full)
+            processing_ids.pop(full, None)
+            sizes.pop(full, None)
+            top_mtimes.pop(full, None)
+            last_event.pop(full, None)
+            baseline_at.pop(full, None)
 
-            sizes[full] = (cur_size, stable_count)
+    # Conversions run in a long-lived pool so long Docker runs never block detection
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="convert")
+    futures: Dict[str, Future] = {}
 
-            if stable_count >= stability_checks:
-                logging.info("Detected stable directory: %s (size %d). Queue position: %d/%d", full, cur_size, idx, pending_count)
-                # mark processing (in-memory only; do not rely on on-disk marker files)
-                known_processing.add(full)
+    try:
+        while not _stop.is_set():
+            for full in [f for f, fut in futures.items() if fut.done()]:
+                finish_conversion(full, futures.pop(full))
 
-        # Collect directories ready for conversion
-        ready_for_conversion = []
-        for name in cand:
-            full = os.path.join(watch_dir, name)
-            if full in known_processing:
-                last_size, stable_count = sizes.get(full, (0, 0))
-                if stable_count >= stability_checks:
-                    ready_for_conversion.append(full)
-
-        # Process conversions in parallel using ThreadPoolExecutor
-        if ready_for_conversion:
-            logging.info("Starting parallel conversion of %d directories with %d workers", len(ready_for_conversion), max_workers)
-            
-            def convert_one(full_path: str) -> tuple[str, int, str]:
-                """Convert a single directory. Returns (path, rc, output_path)."""
-                logging.info("Starting conversion for %s", full_path)
-                try:
-                    rc, expected_out = run_conversion(full_path, out_dir, docker_image=docker_image, dry_run=dry_run)
-                except Exception:
-                    logging.exception("Conversion raised exception for %s", full_path)
-                    rc, expected_out = 99, ""
-                return full_path, rc, expected_out
-            
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = {executor.submit(convert_one, full): full for full in ready_for_conversion}
-                
-                for future in as_completed(futures):
-                    full = futures[future]
+            # Single scandir pass classifies every .d as done (VALID mzML), in-progress
+            # (tracked in-memory) or candidate (has required files)
+            all_dirs = []
+            done_count = 0
+            in_progress_count = len(known_processing)
+            cand = []  # DirEntry.path of candidates, so no per-pass os.path.join
+            done_mzml = existing_mzml_names(out_dir)
+            busy_ids = {i for i in processing_ids.values() if i is not None}
+            path_ids: Dict[str, Tuple[int, int] | None] = {}
+            for d, p, dir_id in _dataset_dirs(watch_dir):
+                path_ids[p] = dir_id
+                all_dirs.append(d)
+                # Only skip if mzML exists AND is valid
+                if mzml_name_for(d) in done_mzml and is_valid_mzml_cached(
+                    expected_output_for_dir(p, out_dir), validate_interval=validate_interval
+                ):
+                    done_count += 1
+                    _unwatch(p)
+                    continue
+                if p in known_processing or dir_id in busy_ids:
+                    continue
+                _watch(p)
+                if has_required_files(p):
+                    cand.append(p)
+
+            if observer is not None:
+                # forget datasets that were removed or renamed since the last pass
+                present = set(path_ids)
+                for p in [p for p in watches if p not in present]:
+                    _unwatch(p)
+                for p in [p for p in last_event if p not in present]:
+                    last_event.pop(p, None)
+                    baseline_at.pop(p, None)
+
+            pending_count = len(cand)
+            logging.info("Status: total=%d pending=%d in_progress=%d done=%d", len(all_dirs), pending_count, in_progress_count, done_count)
+            for idx, full in enumerate(cand, start=1):
+                if full in known_processing:
+                    continue
+
+                if observer is not None:
+                    # event mode: stable once no events arrived for settle_seconds and the
+                    # size still matches the one taken when that quiet window began. Writes
+                    # by other clients on NFS/CIFS raise no events, so the size is the backstop.
+                    now = time.monotonic()
+                    window_start = last_event.setdefault(full, now)
+                    if baseline_at.get(full) != window_start:
+                        # first sighting or fresh activity: record the size the window must keep
+                        # (with the top-level mtime, which validates it in the saved state)
+                        try:
+                            mtime_ns = os.stat(full).st_mtime_ns
+                            cur_size, _ = dir_size_bounded(full)
+                        except Exception as e:
+                            logging.exception("Error computing size for %s: %s", full, e)
+                            continue
+                        sizes[full] = (cur_size, 0)
+                        top_mtimes[full] = mtime_ns
+                        baseline_at[full] = window_start
+                        continue
+                    quiet = now - window_start
+                    if quiet < settle_seconds:
+                        continue
+                    previous = sizes.get(full)
+                    abort_above = previous[0] if previous is not None and previous[0] >= 0 else None
                     try:
-                        full_path, rc, expected_out = future.result()
-                        
-                        if rc == 0:
-                            output_valid = (
-                                bool(expected_out)
-                                and os.path.exists(expected_out)
-                                and is_valid_mzml(expected_out, validate_interval=validate_interval)
-                            )
-                            if output_valid:
-                                logging.info("Conversion succeeded for %s; output: %s", full_path, expected_out)
-                            else:
-                                logging.error(
-                                    "Conversion reported rc=0 but output is missing/invalid for %s (expected %s)",
-                                    full_path,
-                                    expected_out,
-                                )
-                                # treat as failure so it can be retried
-                                sizes.pop(full_path, None)
-                        else:
-                            logging.error("Conversion failed (rc=%s) for %s", rc, full_path)
-                            sizes.pop(full_path, None)
-                        # Track only in-flight directories in memory.
-                        known_processing.discard(full_path)
+                        mtime_ns = os.stat(full).st_mtime_ns
+                        cur_size, complete = dir_size_bounded(full, abort_above=abort_above)
                     except Exception as e:
-                        logging.exception("Worker exception for %s: %s", full, e)
-                        known_processing.discard(full)
-                        sizes.pop(full, None)
+                        logging.exception("Error computing size for %s: %s", full, e)
+                        continue
+                    top_mtimes[full] = mtime_ns
+                    if not complete or abort_above is None or cur_size != abort_above:
+                        # grew without raising events: start a new window from this size
+                        sizes[full] = (cur_size if complete else -1, 0)
+                        last_event[full] = baseline_at[full] = now
+                        continue
+                    sizes[full] = (cur_size, stability_checks)
+                    logging.info("Detected stable directory: %s (size %d, quiet %.0fs). Queue position: %d/%d", full, cur_size, quiet, idx, pending_count)
+                    known_processing.add(full)
+                    processing_ids[full] = path_ids[full]
+                    _unwatch(full)
+                    continue
 
-        time.sleep(poll_interval)
+                # A bumped top-level mtime already proves entries were added or removed,
+                # so skip the recursive walk until the directory itself stops changing.
+                try:
+                    mtime_ns = os.stat(full).st_mtime_ns
+                except OSError:
+                    continue
+                previous_mtime = top_mtimes.get(full)
+                top_mtimes[full] = mtime_ns
+                if previous_mtime is not None and previous_mtime != mtime_ns:
+                    sizes[full] = (-1, 0)
+                    continue
+
+                # Stop walking as soon as the size grows past the last full measurement.
+                # A short-circuited walk leaves no baseline (-1), so the next one is full.
+                previous = sizes.get(full)
+                abort_above = previous[0] if previous is not None and previous[0] >= 0 else None
+                try:
+                    cur_size, complete = dir_size_bounded(full, abort_above=abort_above)
+                except Exception as e:
+                    logging.exception("Error computing size for %s: %s", full, e)
+                    continue
+                last_size, stable_count = previous if previous is not None else (cur_size, 0)
+
+                if complete and cur_size == last_size:
+                    stable_count += 1
+                else:
+                    stable_count = 0
+
+                sizes[full] = (cur_size if complete else -1, stable_count)
+
+                if stable_count >= stability_checks:
+                    logging.info("Detected stable directory: %s (size %d). Queue position: %d/%d", full, cur_size, idx, pending_count)
+                    # mark processing (in-memory only; do not rely on on-disk marker files)
+                    known_processing.add(full)
+                    processing_ids[full] = path_ids[full]
+
+            # Collect directories ready for conversion
+            ready_for_conversion = []
+            for full in cand:
+                if full in known_processing:
+                    last_size, stable_count = sizes.get(full, (0, 0))
+                    if stable_count >= stability_checks:
+                        ready_for_conversion.append(full)
+
+            # Hand ready directories to the conversion pool; the watcher keeps scanning
+            # while they run and collects results at the top of the next pass
+            if ready_for_conversion:
+                logging.info("Queueing conversion of %d directories (%d in flight, %d workers)", len(ready_for_conversion), len(futures), max_workers)
+                for full in ready_for_conversion:
+                    if full not in futures:
+                        futures[full] = executor.submit(convert_one, full)
+                        if observer is not None:
+                            # event-mode stability is time based, so an early pass to
+                            # collect the result is safe (not so for counted polls)
+                            futures[full].add_done_callback(lambda _: _wake.set())
+
+            # Persist state for datasets still pending or in flight, with the top-level
+            # mtime needed to validate entries on the next start
+            tracked = known_processing.union(cand)
+            state = {
+                p: (size, stable_count, top_mtimes[p])
+                for p, (size, stable_count) in sizes.items()
+                if p in tracked and p in top_mtimes
+            }
+            if state != saved_state:
+                try:
+                    save_watch_state(state_path, state)
+                    saved_state = state
+                except OSError as e:
+                    logging.warning("Failed to save watch state to %s: %s", state_path, e)
+
+            if observer is not None:
+                # sleep until the next debounce deadline (at most poll_interval) or a new
+                # dataset event; with nothing settling only the idle rescan is due
+                now = time.monotonic()
+                deadlines = [
+                    t + settle_seconds - now
+                    for p, t in last_event.items()
+                    if p not in known_processing and now < t + settle_seconds
+                ]
+                if deadlines:
+                    timeout = min(float(poll_interval), *deadlines)
+                else:
+                    timeout = float(max(poll_interval, IDLE_RESCAN_SECONDS))
+                _wait_for_events(events, last_event, timeout, settle_seconds)
+            else:
+                # only stop_watching() wakes the poller early; polls must stay evenly spaced
+                _wake.wait(timeout=poll_interval)
+                _wake.clear()
+
+        # Stopped via stop_watching(): drop queued conversions and let running ones
+        # finish, unless asked to abort them
+        executor.shutdown(wait=False, cancel_futures=True)
+        running = {full: fut for full, fut in futures.items() if not fut.cancelled()}
+        futures.clear()
+        if running and not _abort.is_set():
+            logging.info("Stop requested; waiting for %d running conversions (interrupt again to abort)", len(running))
+        elif not running:
+            logging.info("Stop requested")
+        while running and not _abort.is_set():
+            # short timeout keeps the wait interruptible on every platform
+            done, _ = wait(running.values(), timeout=1)
+            for full in [f for f, fut in running.items() if fut in done]:
+                finish_conversion(full, running.pop(full))
+        if running:
+            logging.warning("Aborting %d running conversions", len(running))
+    finally:
+        aborting.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+        with container_lock:
+            if worker_container is not None:
+                stop_worker_container(worker_container)
+                atexit.unregister(stop_worker_container)
+                worker_container = None
+        # conversions were stopped above; wait so their last records reach the log
+        executor.shutdown(wait=True)
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=5)
 
 
 def parse_args():
@@ -467,6 +1232,17 @@ def parse_args():
     p.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"], help="Logging level")
     p.add_argument("--dry-run", action="store_true", help="Don't run conversion, only report candidates")
     p.add_argument("--validate-interval", type=int, default=0, help="Seconds to wait before validating mzML output (default: 0)")
+    p.add_argument("--scan-threads", type=int, default=1, help="Threads used to scan .d directory trees; raise for network shares (default: 1)")
+    p.add_argument(
+        "--no-inotify",
+        action="store_true",
+        help="Poll directory sizes instead of using filesystem events (watchdog)",
+    )
+    p.add_argument(
+        "--no-reuse-container",
+        action="store_true",
+        help="Start a fresh container per conversion instead of docker exec into one long-lived container",
+    )
     return p.parse_args()
 
 
@@ -476,8 +1252,33 @@ def main():
     level = getattr(logging, args.log_level.upper(), logging.INFO)
     # default to a conversion.log inside the watched directory when not provided
     logfile = args.log_file if args.log_file else os.path.join(args.dir, "conversion.log")
-    logging.basicConfig(level=level, filename=logfile, filemode="a", format="%(asctime)s %(levelname)s: %(message)s")
+    # Log records are queued and written by a listener thread, so the watch loop and
+    # conversion workers never block on file I/O
+    file_handler = logging.FileHandler(logfile, mode="a")
+    file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s: %(message)s"))
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
     logging.info("Logging to %s", logfile)
+    set_scan_threads(args.scan_threads)
+
+    # Only set events in these handlers: logging from a handler that interrupted a
+    # QueueHandler put() would deadlock on the queue's non-reentrant lock.
+    def _request_stop(signum, frame):
+        # a second Ctrl-C raises KeyboardInterrupt, which aborts running conversions
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        stop_watching()
+
+    def _request_abort(signum, frame):
+        # SIGTERM comes from service managers (systemd, docker stop) that follow up
+        # with SIGKILL, so running conversions are stopped rather than awaited
+        stop_watching(abort=True)
+
+    signal.signal(signal.SIGINT, _request_stop)
+    signal.signal(signal.SIGTERM, _request_abort)
 
     try:
         watch_directory(
@@ -489,9 +1290,15 @@ def main():
             docker_image=args.docker_image,
             validate_interval=args.validate_interval,
             max_workers=args.max_workers,
+            use_fs_events=not args.no_inotify,
+            reuse_container=not args.no_reuse_container,
+            # Docker output written straight to the log counts as INFO; stricter levels pipe it
+            docker_log_file=logfile if level <= logging.INFO else None,
         )
     except KeyboardInterrupt:
         logging.info("Exiting on user interrupt")
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":